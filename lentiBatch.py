@@ -0,0 +1,203 @@
+# UIなしでレンチキュラー画像を生成するためのスクリプト
+#
+# 使い方:
+#   blender -b scene.blend -P lentiBatch.py -- --output-dir /path/to/output --dpi 300 --lpi 60 --cam-num 5
+#
+# スタジオ構築・設定反映・全カメラのレンダリング・レンチキュラー画像と立体視画像の生成までを順番に実行し、
+# 各工程の所要時間を標準出力（"LENTI_RESULT " から始まる1行のJSON）と出力先の pipeline_result.json に書き出す。
+# 終了コードは 成功: 0, 失敗: 1, 引数・設定の誤り: 2
+import argparse
+import json
+import os
+import sys
+import time
+import traceback
+
+import bpy
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import myAddon  # noqa: E402
+
+RESULT_PREFIX = 'LENTI_RESULT '             # 結果出力行の接頭辞
+RESULT_FILE_NAME = 'pipeline_result.json'   # 結果を書き出すファイル名
+
+EXIT_SUCCESS = 0
+EXIT_FAILURE = 1
+EXIT_USAGE = 2
+
+# 引数の最小値（アドオンのプロパティの min と同じ。下回る値はプロパティで丸められてしまうため引数の誤りとする）
+ARG_MINIMUMS = [
+    ('dpi', 100),
+    ('lpi', 10),
+    ('print_width_cm', 1.0),
+    ('print_height_cm', 1.0),
+    ('cam_num', 2),
+    ('cam_angle_diff', 1.0),
+    ('focus_dist', 1.0),
+]
+
+
+# 引数・設定の誤り（終了コード 2 で終了する）
+class UsageError(Exception):
+    pass
+
+
+# コマンドライン引数を解析する（"--" 以降がスクリプトへの引数）
+def parse_args(argv):
+    argv = argv[argv.index('--') + 1:] if '--' in argv else []
+
+    parser = argparse.ArgumentParser(prog='lentiBatch.py', description='レンチキュラー画像をUIなしで生成します。')
+    parser.add_argument('--output-dir', required=True, help='出力先ディレクトリ')
+    parser.add_argument('--dpi', type=int, help='印刷DPI')
+    parser.add_argument('--lpi', type=int, help='レンチキュラーLPI')
+    parser.add_argument('--print-width-cm', type=float, help='印刷幅(cm)')
+    parser.add_argument('--print-height-cm', type=float, help='印刷高さ(cm)')
+    parser.add_argument('--cam-num', type=int, help='レンダリングカメラ数')
+    parser.add_argument('--cam-angle-diff', type=float, help='レンダリングカメラの配置間隔(度)')
+    parser.add_argument('--focus-dist', type=float, help='焦点距離')
+    parser.add_argument('--camera', help='メインカメラのオブジェクト名（省略時は最初のカメラ）')
+    parser.add_argument('--resume', action='store_true', help='完了済みのカメラはレンダリングしない')
+    parser.add_argument('--no-stereoscopic', action='store_true', help='立体視画像を生成しない')
+    args = parser.parse_args(argv)
+
+    for name, minimum in ARG_MINIMUMS:
+        value = getattr(args, name)
+        if value is not None and value < minimum:
+            parser.error('--%s must be >= %s (got %s)' % (name.replace('_', '-'), minimum, value))
+    return args
+
+
+# 引数で指定された設定をシーンに反映する（指定されていない設定は .blend の値を使う）
+def apply_settings(scene, args):
+    scene.outputDirectory = args.output_dir
+
+    if args.camera is not None:
+        names = [cam.name for cam in myAddon.get_camera_list()]
+        if args.camera not in names:
+            raise UsageError('camera not found: %s' % args.camera)
+        scene.mainCamera = str(names.index(args.camera))
+
+    settings = [
+        ('DPI', args.dpi),
+        ('LPI', args.lpi),
+        ('printWidthCm', args.print_width_cm),
+        ('printHeightCm', args.print_height_cm),
+        ('focusDist', args.focus_dist),
+        ('camAngleDiff', args.cam_angle_diff),
+        ('camNum', args.cam_num),
+    ]
+    for name, value in settings:
+        if value is not None:
+            setattr(scene, name, value)
+
+
+# オペレーターを実行し、完了しなければ例外を送出する
+def call_operator(operator, **kwargs):
+    result = operator(**kwargs)
+    if 'FINISHED' not in result:
+        raise RuntimeError('%s returned %s' % (operator.idname(), sorted(result)))
+
+
+# スタジオ構築からレンチキュラー画像・立体視画像の生成までを実行する
+def run_pipeline(args, result):
+    scene = bpy.context.scene
+    timings = result['timings']
+
+    start_time = time.perf_counter()
+    apply_settings(scene, args)
+
+    # レンダリング計画が成り立たなければレンダリングしない
+    plan = myAddon.RenderPlan(scene)
+    result['plan'] = plan.to_dict()
+    if not plan.is_consistent():
+        raise UsageError(' '.join(plan.errors))
+
+    call_operator(bpy.ops.lenti.apply_setting)
+    if myAddon.LENTI_OT_BuildStudio.get_focus_object() is None:
+        call_operator(bpy.ops.lenti.build_studio)
+    else:
+        myAddon.LENTI_OT_BuildStudio.arrange_camera(bpy.context)
+    timings['setup'] = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    timings['render_views'] = myAddon.LENTI_OT_Rendering.render_all_blocking(resume=args.resume)
+    timings['render'] = time.perf_counter() - start_time
+
+    # 現在の設定で出力されていないカメラがあれば失敗とする
+    manifest = myAddon.RenderManifest.load()
+    camera_list = myAddon.get_render_camera_list()
+    invalid = [cam.name for cam in camera_list if not manifest.is_valid_view(cam)]
+    if len(camera_list) != scene.camNum:
+        raise RuntimeError('render cameras missing: %d of %d' % (len(camera_list), scene.camNum))
+    if len(invalid) > 0:
+        raise RuntimeError('render failed: %s' % ', '.join(invalid))
+    if len(myAddon.LENTI_OT_Rendering.get_valid_image_path_list()) != scene.camNum:
+        raise RuntimeError('rendered views do not match camNum %d' % scene.camNum)
+
+    start_time = time.perf_counter()
+    call_operator(bpy.ops.lenti.generate_result_image)
+    timings['lenticular'] = time.perf_counter() - start_time
+
+    outputs = {'lenticular': myAddon.LENTI_OT_GenerateResultImage.get_result_image_path()}
+
+    if not args.no_stereoscopic:
+        start_time = time.perf_counter()
+        # 両端のカメラの画像を左右に並べる
+        output_directory = myAddon.LENTI_OT_Rendering.get_output_directory()
+        left_path, right_path = [
+            os.path.join(output_directory, myAddon.LENTI_OT_Rendering.get_image_file_name(camera_list[i]))
+            for i in (0, scene.camNum - 1)]
+        call_operator(bpy.ops.lenti.generate_stereoscopic, left_image_prop=left_path, right_image_prop=right_path)
+        timings['stereoscopic'] = time.perf_counter() - start_time
+        outputs['stereoscopic'] = myAddon.ShowStereoscopicDialogMenu.get_result_image_path()
+
+    return outputs
+
+
+def main():
+    args = parse_args(sys.argv)
+
+    # アドオンとして有効化されていなければ登録する
+    try:
+        myAddon.register()
+    except (ValueError, RuntimeError):
+        pass
+
+    start_time = time.perf_counter()
+    timings = {}
+    result = {'status': 'ok', 'blend_file': bpy.data.filepath, 'timings': timings}
+    exit_code = EXIT_SUCCESS
+
+    try:
+        result['outputs'] = run_pipeline(args, result)
+    except UsageError as e:
+        result['status'] = 'error'
+        result['error'] = str(e)
+        exit_code = EXIT_USAGE
+        print('lentiBatch.py: error: %s' % e, file=sys.stderr)
+    except Exception as e:
+        traceback.print_exc()
+        result['status'] = 'error'
+        result['error'] = str(e)
+        exit_code = EXIT_FAILURE
+
+    timings['total'] = time.perf_counter() - start_time
+
+    # 結果を書き出す（書き出せなければ成功扱いにしない）
+    try:
+        print(RESULT_PREFIX + json.dumps(result, sort_keys=True))
+        bpy.context.scene.outputDirectory = args.output_dir
+        if not os.path.isdir(myAddon.get_output_base_directory()):
+            os.makedirs(myAddon.get_output_base_directory())
+        with open(os.path.join(myAddon.get_output_base_directory(), RESULT_FILE_NAME), 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=2, sort_keys=True)
+    except Exception:
+        traceback.print_exc()
+        if exit_code == EXIT_SUCCESS:
+            exit_code = EXIT_FAILURE
+
+    sys.exit(exit_code)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,16 @@
+import hashlib
+import json
 import math
 import os
 import queue
+import struct
+import time
+import zlib
 from math import radians
 
 import bpy
 import mathutils
+import numpy as np
 from bpy_extras.io_utils import ExportHelper
 
 # アドオンに関する情報を保持する、bl_info変数
@@ -206,6 +212,12 @@ def get_camera_list():
     return [cam for cam in bpy.data.objects if cam.type == "CAMERA"]
 
 
+# 配置したレンダリングカメラをカメラ番号順にすべて取得する
+def get_render_camera_list():
+    camera_list = [LENTI_OT_BuildStudio.get_render_camera(i) for i in range(bpy.context.scene.camNum)]
+    return [cam for cam in camera_list if cam is not None]
+
+
 # 選択中のカメラを取得する
 def get_scene_camera():
     selected_index = int(bpy.context.scene.mainCamera)
@@ -281,6 +293,404 @@ def open_image_in_main_window(image_file):
     bpy.context.area.spaces[0].image = bpy.data.images.load(image_file)
 
 
+# 画像を画像エディタで開く（画像エディタがなければメイン画面で開く）
+def show_image_in_image_editor(image):
+    for area in bpy.context.screen.areas:
+        if area.type == 'IMAGE_EDITOR':
+            area.spaces[0].image = image
+            area.tag_redraw()
+            return
+
+    bpy.context.area.type = 'IMAGE_EDITOR'
+    bpy.context.area.spaces[0].image = image
+
+
+# 画像エディタを再描画する
+def redraw_image_editor():
+    if bpy.context.screen is None:
+        return
+
+    for area in bpy.context.screen.areas:
+        if area.type == 'IMAGE_EDITOR':
+            area.tag_redraw()
+
+
+# 指定した列に割り当てる視点画像のインデックスを取得する
+def get_view_index(x, image_count, px_per_lenz):
+    return math.floor(x * image_count / px_per_lenz) % image_count
+
+
+# 出力画像の列を同じ視点画像の連続した列から取る区間のリスト [開始列, 終了列, 画像インデックス, 視点画像の開始列] を取得する
+# 視点画像の幅が出力画像と同じなら同じ列を参照し、
+# 1/画像数の幅なら（レンズごとに自分の列だけをレンダリングした場合）レンズ L の k 列目を L * (px_per_lenz / 画像数) + k 列目から取る
+def get_interlace_column_runs(width, image_count, px_per_lenz, view_width=None):
+    if view_width is None:
+        view_width = width
+    columns_per_view = px_per_lenz // image_count
+
+    runs = []
+    for x in range(width):
+        img_select = get_view_index(x, image_count, px_per_lenz)
+        if view_width == width:
+            source_x = x
+        else:
+            source_x = (x // px_per_lenz) * columns_per_view + x % columns_per_view
+
+        if len(runs) > 0 and runs[-1][2] == img_select and runs[-1][3] + runs[-1][1] - runs[-1][0] == source_x:
+            runs[-1][1] = x + 1
+        else:
+            runs.append([x, x + 1, img_select, source_x])
+    return runs
+
+
+# 列の区間のリストに従って視点画像のピクセルを並べる
+def interlace_pixels(pixels_list, view_width, height, runs, channels=4):
+    result = pixels_list[0][:0]
+    for y in range(height):
+        row = y * view_width
+        for start, end, img_select, source_x in runs:
+            result += pixels_list[img_select][(row + source_x) * channels:(row + source_x + end - start) * channels]
+    return result
+
+
+# 列の区間のリストに従って視点画像のピクセル配列（高さ x 幅 x 1ピクセルのバイト数）を並べる
+def interlace_pixel_arrays(array_list, runs):
+    first = array_list[0]
+    result = np.empty((first.shape[0], runs[-1][1]) + first.shape[2:], dtype=first.dtype)
+    for start, end, img_select, source_x in runs:
+        result[:, start:end] = array_list[img_select][:, source_x:source_x + end - start]
+    return result
+
+
+# 視点画像を印刷時の縦横比に戻すための横方向の拡大率を取得する（1/カメラ数の幅でレンダリングした場合はカメラ数）
+def get_view_stretch(scene):
+    return max(1, round(scene.render.pixel_aspect_x / scene.render.pixel_aspect_y))
+
+
+# レンダリング画像が壊れている（途中までしか書き込まれていないなど）
+class BrokenImageError(Exception):
+    def __init__(self, path):
+        super().__init__('レンダリング画像が壊れています: %s' % path)
+        self.path = path
+
+
+# 整数のまま合成するためのPNG画像（8bit/16bit、パレット・インターレースなし）
+class PngImage:
+    SIGNATURE = b'\x89PNG\r\n\x1a\n'
+    CHANNELS = {0: 1, 2: 3, 4: 2, 6: 4}     # カラータイプごとのチャンネル数
+    STRIP_ROWS = 256                        # フィルタ解除で一度に扱う行数
+
+    def __init__(self, width, height, bit_depth, color_type, data):
+        self.width = width
+        self.height = height
+        self.bit_depth = bit_depth
+        self.color_type = color_type
+        self.data = data        # 上の行から順に並べたフィルタ解除済みのピクセル（高さ x 幅 x 1ピクセルのバイト数）
+
+    # 1ピクセルあたりのバイト数
+    @property
+    def bytes_per_pixel(self):
+        return self.CHANNELS[self.color_type] * self.bit_depth // 8
+
+    # ピクセル形式が同じか
+    def is_same_format(self, other):
+        return (self.width, self.height, self.bit_depth, self.color_type) == \
+               (other.width, other.height, other.bit_depth, other.color_type)
+
+    # PNGファイルを読み込む
+    # 整数のまま扱えない形式であれば None を返し、途中までしか書き込まれていないなど壊れていれば BrokenImageError を送出する
+    @classmethod
+    def load(cls, path):
+        if os.path.splitext(path)[1].lower() != '.png':
+            return None
+
+        with open(path, 'rb') as f:
+            buf = f.read()
+        if not buf.startswith(cls.SIGNATURE):
+            raise BrokenImageError(path)
+
+        header = None
+        idat = []
+        is_complete = False
+        pos = len(cls.SIGNATURE)
+        buf = memoryview(buf)   # チャンクをコピーせずに参照する
+        try:
+            while pos + 8 <= len(buf):
+                length, chunk_type = struct.unpack('>I4s', buf[pos:pos + 8])
+                chunk = buf[pos + 8:pos + 8 + length]
+                pos += 12 + length
+                if chunk_type == b'IHDR':
+                    header = struct.unpack('>IIBBBBB', chunk)
+                elif chunk_type == b'IDAT':
+                    idat.append(chunk)
+                elif chunk_type == b'IEND':
+                    is_complete = True
+                    break
+            if header is None or not is_complete:
+                raise BrokenImageError(path)
+
+            width, height, bit_depth, color_type, _, _, interlace = header
+            if bit_depth not in (8, 16) or color_type not in cls.CHANNELS or interlace != 0:
+                return None
+
+            image = cls(width, height, bit_depth, color_type, None)
+            compressed = b''.join(idat)
+            del buf, idat, chunk
+            raw = zlib.decompress(compressed)
+            del compressed
+            if len(raw) != height * (width * image.bytes_per_pixel + 1):
+                raise BrokenImageError(path)
+            image.data = cls.unfilter(raw, width, height, image.bytes_per_pixel)
+        except (struct.error, zlib.error, ValueError):
+            raise BrokenImageError(path)
+
+        return image
+
+    # 読み込み時に解除後のピクセルとは別に確保するメモリの見積もり(バイト)
+    # 展開前後のデータを同時に持つ時点と、展開したデータ・斜め並べ替え用の配列・その添字を同時に持つ時点の大きい方
+    @classmethod
+    def get_decode_peak_bytes(cls, width, height, bpp):
+        raw_bytes = height * (width * bpp + 1)
+        strip_rows = min(height, cls.STRIP_ROWS)
+        strip_bytes = (width + strip_rows + 1) * (strip_rows + 1) * bpp * 2
+        index_bytes = width * strip_rows * np.dtype(np.intp).itemsize * 2
+        return max(raw_bytes * 2, raw_bytes + strip_bytes + index_bytes)
+
+    # スキャンラインのフィルタを解除する
+    # メモリを抑えるため STRIP_ROWS 行ずつ解除し、計算途中の値だけを16bitに広げる
+    @classmethod
+    def unfilter(cls, raw, width, height, bpp):
+        lines = np.frombuffer(raw, dtype=np.uint8).reshape(height, width * bpp + 1)
+        filter_types = lines[:, 0]
+        filtered = lines[:, 1:].reshape(height, width, bpp)
+        if np.any(filter_types > 4):
+            raise ValueError('unknown filter type')
+
+        data = np.empty((height, width, bpp), dtype=np.uint8)
+        prev = np.zeros((width, bpp), dtype=np.uint8)     # 1行上の画素（先頭行は0）
+        for y0 in range(0, height, cls.STRIP_ROWS):
+            y1 = min(height, y0 + cls.STRIP_ROWS)
+            if np.all(filter_types[y0:y1] <= 2):
+                cls.unfilter_rows(filtered, filter_types, data, prev, y0, y1)
+            else:
+                cls.unfilter_diagonals(filtered, filter_types, data, prev, y0, y1)
+            prev = data[y1 - 1]
+        return data
+
+    # None・Sub・Upだけの行を1行ずつまとめて解除する
+    @classmethod
+    def unfilter_rows(cls, filtered, filter_types, data, prev, y0, y1):
+        for y in range(y0, y1):
+            if filter_types[y] == 0:
+                data[y] = filtered[y]
+            elif filter_types[y] == 1:
+                data[y] = np.cumsum(filtered[y], axis=0, dtype=np.uint8)
+            else:
+                data[y] = filtered[y] + prev
+            prev = data[y]
+
+    # Average・Paethを含む行を、左・上・左上の画素が確定した斜め一列ずつまとめて解除する
+    # 行 y0 からの i 行目の画素 x を skewed[x + i + 2, i + 1] に置くと、斜め一列がメモリ上で連続した範囲になる
+    # （skewed[x + 1, 0] には1行上の画素を置く）
+    @classmethod
+    def unfilter_diagonals(cls, filtered, filter_types, data, prev, y0, y1):
+        height = y1 - y0
+        width, bpp = prev.shape
+        rows = np.arange(height)[:, np.newaxis]
+        diagonals = np.arange(width)[np.newaxis, :] + rows
+        skewed_filtered = np.zeros((width + height - 1, height, bpp), dtype=np.uint8)
+        skewed_filtered[diagonals, rows] = filtered[y0:y1]
+        skewed = np.zeros((width + height + 1, height + 1, bpp), dtype=np.uint8)
+        skewed[1:width + 1, 0] = prev
+
+        # 行ごとのフィルタの種類を予測値の重みにしておく
+        is_sub, is_up, is_average, is_paeth = [
+            (filter_types[y0:y1] == i).astype(np.int16)[:, np.newaxis] for i in range(1, 5)]
+
+        for t in range(width + height - 1):
+            lo = max(0, t - width + 1)
+            hi = min(height, t + 1)
+            a = skewed[t + 1, lo + 1:hi + 1].astype(np.int16)
+            b = skewed[t + 1, lo:hi].astype(np.int16)
+            c = skewed[t, lo:hi].astype(np.int16)
+
+            b_c = b - c
+            a_c = a - c
+            pa = np.abs(b_c)
+            pb = np.abs(a_c)
+            pc = np.abs(a_c + b_c)
+            paeth = np.where((pa <= pb) & (pa <= pc), a, np.where(pb <= pc, b, c))
+
+            predictor = is_sub[lo:hi] * a + is_up[lo:hi] * b + is_average[lo:hi] * ((a + b) >> 1) + \
+                is_paeth[lo:hi] * paeth
+            skewed[t + 2, lo + 1:hi + 1] = (skewed_filtered[t, lo:hi] + predictor) & 0xff
+        data[y0:y1] = skewed[diagonals + 2, rows + 1]
+
+    # PNGファイルに書き出す
+    def save(self, path):
+        raw = np.zeros((self.height, self.width * self.bytes_per_pixel + 1), dtype=np.uint8)
+        raw[:, 1:] = self.data.reshape(self.height, -1)
+        header = struct.pack('>IIBBBBB', self.width, self.height, self.bit_depth, self.color_type, 0, 0, 0)
+
+        with open(path, 'wb') as f:
+            f.write(self.SIGNATURE)
+            for chunk_type, chunk in ((b'IHDR', header), (b'IDAT', zlib.compress(raw.tobytes())), (b'IEND', b'')):
+                f.write(struct.pack('>I', len(chunk)) + chunk_type + chunk)
+                f.write(struct.pack('>I', zlib.crc32(chunk_type + chunk) & 0xffffffff))
+
+
+# 整数のまま合成できるPNG画像のリストを読み込む（形式が揃っていなければ None を返す。壊れていれば BrokenImageError を送出する）
+def load_png_image_list(path_list):
+    image_list = []
+    for path in path_list:
+        image = PngImage.load(path)
+        if image is None or (len(image_list) > 0 and not image.is_same_format(image_list[0])):
+            return None
+        image_list.append(image)
+    return image_list
+
+
+# ファイルのチェックサムのキャッシュ（パスごとに 更新日時, サイズ, チェックサム を保持する）
+file_checksum_cache = {}
+
+
+# ファイルのチェックサムを取得する（更新されていなければキャッシュを返す）
+def get_file_checksum(path):
+    stat = os.stat(path)
+    cached = file_checksum_cache.get(path)
+    if cached is not None and cached[0] == stat.st_mtime and cached[1] == stat.st_size:
+        return cached[2]
+
+    sha = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1024 * 1024), b''):
+            sha.update(block)
+    checksum = sha.hexdigest()
+    file_checksum_cache[path] = (stat.st_mtime, stat.st_size, checksum)
+    return checksum
+
+
+# レンダリング結果に影響する設定のフィンガープリントを取得する
+def get_render_fingerprint(camera):
+    scene = bpy.context.scene
+    render = scene.render
+    settings = {
+        'camera': [round(v, 6) for row in camera.matrix_world for v in row],
+        'lens': round(camera.data.lens, 6),
+        'sensor_width': round(camera.data.sensor_width, 6),
+        'resolution': [render.resolution_x, render.resolution_y, render.resolution_percentage],
+        'pixel_aspect': [round(render.pixel_aspect_x, 6), round(render.pixel_aspect_y, 6)],
+        'engine': render.engine,
+        'file_format': render.image_settings.file_format,
+        'color_mode': render.image_settings.color_mode,
+        'color_depth': render.image_settings.color_depth,
+        'frame': scene.frame_current,
+        'camNum': scene.camNum,
+        'camAngleDiff': round(scene.camAngleDiff, 6),
+        'focusDist': round(scene.focusDist, 6),
+    }
+    if hasattr(scene, 'cycles'):
+        settings['samples'] = scene.cycles.samples
+    return hashlib.sha256(json.dumps(settings, sort_keys=True).encode('utf-8')).hexdigest()
+
+
+# レンダリングジョブの進捗を記録するマニフェスト
+class RenderManifest:
+    FILE_NAME = 'render_manifest.json'
+    VERSION = 1
+
+    STATUS_RENDERING = 'rendering'  # レンダリング中（中断・クラッシュした場合はこのまま残る）
+    STATUS_DONE = 'done'            # レンダリング完了
+    STATUS_FAILED = 'failed'        # 出力ファイルが見つからない
+
+    def __init__(self, views=None):
+        self.views = views if views is not None else {}     # カメラ名ごとの 状態, フィンガープリント, ファイル名, チェックサム
+
+    # マニフェストのパスを取得する
+    @classmethod
+    def get_path(cls):
+        return os.path.join(get_output_base_directory(), cls.FILE_NAME)
+
+    # マニフェストが存在するか
+    @classmethod
+    def exists(cls):
+        return os.path.isfile(cls.get_path())
+
+    # マニフェストを読み込む（なければ空のマニフェストを返す）
+    @classmethod
+    def load(cls):
+        if not cls.exists():
+            return cls()
+
+        try:
+            with open(cls.get_path(), 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except ValueError:
+            # 書き込み途中で壊れていれば記録なしとして扱う
+            return cls()
+
+        if data.get('version') != cls.VERSION:
+            return cls()
+        return cls(data.get('views', {}))
+
+    # マニフェストを保存する
+    def save(self):
+        if not os.path.isdir(get_output_base_directory()):
+            os.makedirs(get_output_base_directory())
+
+        # 書き込み途中で中断されても壊れないよう一時ファイルから置き換える
+        tmp_path = self.get_path() + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': self.VERSION, 'views': self.views}, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.get_path())
+
+    # カメラのレンダリング状況を記録する
+    def set_view(self, camera, status, file_name, checksum=None):
+        self.views[camera.name] = {
+            'status': status,
+            'fingerprint': get_render_fingerprint(camera),
+            'file': file_name,
+            'checksum': checksum,
+        }
+        self.save()
+
+    # カメラのレンダリング開始を記録する
+    def begin_view(self, camera):
+        self.set_view(camera, self.STATUS_RENDERING, LENTI_OT_Rendering.get_image_file_name(camera))
+
+    # カメラのレンダリング完了を記録する
+    def finish_view(self, camera):
+        file_name = LENTI_OT_Rendering.get_image_file_name(camera)
+        path = os.path.join(LENTI_OT_Rendering.get_output_directory(), file_name)
+        if os.path.isfile(path):
+            self.set_view(camera, self.STATUS_DONE, file_name, get_file_checksum(path))
+        else:
+            self.set_view(camera, self.STATUS_FAILED, file_name)
+
+    # 記録されたファイルが完全に出力されているか
+    def is_valid_file(self, name):
+        view = self.views.get(name)
+        if view is None or view['status'] != self.STATUS_DONE:
+            return False
+
+        path = os.path.join(LENTI_OT_Rendering.get_output_directory(), view['file'])
+        return os.path.isfile(path) and get_file_checksum(path) == view['checksum']
+
+    # 現在の設定でカメラのレンダリングが完了しているか
+    def is_valid_view(self, camera):
+        view = self.views.get(camera.name)
+        if view is None or view['fingerprint'] != get_render_fingerprint(camera):
+            return False
+        return self.is_valid_file(camera.name)
+
+    # 現在のレンダリングカメラ以外の記録を破棄する
+    def prune(self, camera_list):
+        names = [cam.name for cam in camera_list]
+        for name in [name for name in self.views if name not in names]:
+            del self.views[name]
+        self.save()
+
+
 # レンダリングする
 class LENTI_OT_Rendering(bpy.types.Operator):
     bl_idname = "lenti.rendering"
@@ -293,6 +703,8 @@ class LENTI_OT_Rendering(bpy.types.Operator):
     is_rendering = None     # レンダリング中かどうか
     render_queue = None     # レンダリング待ちカメラのキュー
     priv_scene_cam = None   # レンダリング開始前のアクティブカメラを保持しておく
+    manifest = None         # レンダリングジョブのマニフェスト
+    current_camera = None   # レンダリング中のカメラ
 
     # 出力先ディレクトリを取得する
     @classmethod
@@ -304,9 +716,33 @@ class LENTI_OT_Rendering(bpy.types.Operator):
     def get_rendered_image_path_list(cls):
         return [os.path.join(cls.get_output_directory(), f) for f in os.listdir(cls.get_output_directory())]
 
+    # 現在の設定で完全に出力されているレンダリング画像のパスのリストをカメラ番号順に取得する
+    # マニフェストがなければ（以前のバージョンで出力した場合など）レンダリングカメラの画像をすべて返す
+    @classmethod
+    def get_valid_image_path_list(cls):
+        if not RenderManifest.exists():
+            path_list = cls.get_rendered_image_path_list()
+            name_list = [LENTI_OT_BuildStudio.get_render_camera_name(i) for i in range(bpy.context.scene.camNum)]
+            return [path for name in name_list for path in path_list
+                    if os.path.splitext(os.path.basename(path))[0] == name]
+
+        manifest = RenderManifest.load()
+        return [os.path.join(cls.get_output_directory(), cls.get_image_file_name(cam))
+                for cam in get_render_camera_list() if manifest.is_valid_view(cam)]
+
+    # カメラのレンダリング画像のファイル名を取得する
+    @classmethod
+    def get_image_file_name(cls, camera):
+        return camera.name + bpy.context.scene.render.file_extension
+
+    # レンダリング待ちに登録するカメラのリストを取得する
+    def get_queue_camera_list(self):
+        return get_render_camera_list()
+
     # 指定したカメラでレンダリングする
+    # blocking が True ならレンダリング完了まで戻らない（UIなしで実行する場合）
     @classmethod
-    def render(cls, camera):
+    def render(cls, camera, blocking=False):
         # 出力先ディレクトリがなければ作成する
         if not os.path.isdir(cls.get_output_directory()):
             os.makedirs(cls.get_output_directory())
@@ -317,7 +753,39 @@ class LENTI_OT_Rendering(bpy.types.Operator):
         bpy.context.scene.render.filepath = file
 
         # レンダリング
-        bpy.ops.render.render('INVOKE_DEFAULT', write_still=True)
+        if blocking:
+            bpy.ops.render.render(write_still=True)
+        else:
+            bpy.ops.render.render('INVOKE_DEFAULT', write_still=True)
+
+    # 配置したカメラで順番にレンダリングする（UIなしで実行するため、完了まで戻らない）
+    # resume が True なら完了済みで設定が変わっていないカメラはレンダリングしない
+    # カメラ名ごとのレンダリング時間(秒)を返す
+    @classmethod
+    def render_all_blocking(cls, resume=False):
+        plan = RenderPlan(bpy.context.scene)
+        if not plan.is_ready(bpy.context.scene):
+            raise ValueError('render plan is not applied: %s' % ' '.join(plan.errors))
+
+        priv_scene_cam = bpy.context.scene.camera
+        manifest = RenderManifest.load()
+        manifest.prune(get_render_camera_list())
+        timings = {}
+
+        for cam in get_render_camera_list():
+            if resume and manifest.is_valid_view(cam):
+                continue
+
+            start_time = time.perf_counter()
+            manifest.begin_view(cam)
+            cls.render(cam, blocking=True)
+            manifest.finish_view(cam)
+            timings[cam.name] = time.perf_counter() - start_time
+
+        # シーンカメラを元に戻す
+        bpy.context.scene.camera = priv_scene_cam
+
+        return timings
 
     # 配置したカメラでレンダリングする
     def start_rendering(self):
@@ -325,15 +793,19 @@ class LENTI_OT_Rendering(bpy.types.Operator):
         self.is_cancel = False
         self.is_rendering = False
 
+        self.current_camera = None
+
         # 元のシーンカメラを記憶しておく
         self.priv_scene_cam = get_scene_camera()
 
+        # マニフェスト読み込み（カメラ数を減らした場合などの不要な記録は破棄する）
+        self.manifest = RenderManifest.load()
+        self.manifest.prune(get_render_camera_list())
+
         # レンダリングカメラを登録
         self.render_queue = queue.Queue()
-        for cam in bpy.data.objects:
-            if cam.type == 'CAMERA' and cam.name in [LENTI_OT_BuildStudio.get_render_camera_name(i) for i in
-                                                     range(bpy.context.scene.camNum)]:
-                self.render_queue.put(cam)
+        for cam in self.get_queue_camera_list():
+            self.render_queue.put(cam)
 
         # レンダリング状況通知を受け取るためのハンドラー登録
         bpy.app.handlers.render_pre.append(self.pre)
@@ -350,6 +822,10 @@ class LENTI_OT_Rendering(bpy.types.Operator):
         if not is_select_output_directory():
             return False
 
+        # レンダリング計画どおりの解像度が設定されていれば
+        if not RenderPlan(context.scene).is_ready(context.scene):
+            return False
+
         # レンダリング用カメラがあれば
         for obj in bpy.data.objects:
             if obj.type == 'CAMERA' and obj.name in [LENTI_OT_BuildStudio.get_render_camera_name(i) for i in
@@ -372,6 +848,11 @@ class LENTI_OT_Rendering(bpy.types.Operator):
         if event.type == 'TIMER':
             print('modal')
 
+            # レンダリングが完了したカメラをマニフェストに記録する
+            if self.is_rendering is False and self.current_camera is not None and not self.is_cancel:
+                self.manifest.finish_view(self.current_camera)
+                self.current_camera = None
+
             if (self.render_queue.empty() and self.is_rendering is False) or self.is_cancel:
                 print('finish')
                 # ハンドラー解除
@@ -387,7 +868,9 @@ class LENTI_OT_Rendering(bpy.types.Operator):
             else:
                 if self.is_rendering is False:
                     self.is_rendering = True
-                    self.render(self.render_queue.get())
+                    self.current_camera = self.render_queue.get()
+                    self.manifest.begin_view(self.current_camera)
+                    self.render(self.current_camera)
                 else:
                     # レンダリングが開始されてない事があるためレンダリングを定期的にコールする
                     bpy.ops.render.render('INVOKE_DEFAULT', write_still=True)
@@ -401,6 +884,127 @@ class LENTI_OT_Rendering(bpy.types.Operator):
         return {'RUNNING_MODAL'}
 
 
+# 未完了・無効なカメラだけレンダリングし直す
+class LENTI_OT_ResumeRendering(LENTI_OT_Rendering):
+    bl_idname = "lenti.resume_rendering"
+    bl_label = "撮影再開"
+    bl_description = "中断したレンダリングを再開します。完了済みで設定が変わっていないカメラはレンダリングしません。"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    # レンダリングが完了していないカメラのリストを取得する
+    def get_queue_camera_list(self):
+        return [cam for cam in super().get_queue_camera_list() if not self.manifest.is_valid_view(cam)]
+
+    @classmethod
+    def poll(cls, context):
+        return super().poll(context) and RenderManifest.exists()
+
+
+# 印刷サイズ・レンチキュラー設定から算出したレンダリング計画
+class RenderPlan:
+    INCH_MM = 25.4
+    CHANNELS = {'BW': 1, 'RGB': 3, 'RGBA': 4}    # カラーモードごとのチャンネル数
+    FLOAT_BYTES_PER_CHANNEL = 32                # 浮動小数点で合成する場合の1チャンネルあたりのバイト数（Pythonのfloatのリスト）
+
+    def __init__(self, scene):
+        self.cam_num = scene.camNum
+        self.dpi = scene.DPI
+        self.px_per_lenz = scene.DPI / scene.LPI
+        self.errors = []    # 計画が成り立たない理由
+
+        if not self.px_per_lenz.is_integer():
+            self.errors.append('1レンズあたりのピクセル数が整数になりません。')
+        elif self.cam_num > self.px_per_lenz or self.px_per_lenz % self.cam_num != 0:
+            self.errors.append('カメラ数が1レンズあたりのピクセル数 %d を割り切れません。' % self.px_per_lenz)
+
+        # 印刷幅はレンズ単位で揃える（端に欠けたレンズを作らない）
+        self.lens_count = max(1, round(scene.printWidthCm * 10 / self.INCH_MM * scene.LPI))
+        self.width = self.lens_count * int(self.px_per_lenz)
+        self.height = max(1, round(scene.printHeightCm * 10 / self.INCH_MM * scene.DPI))
+
+        # 各カメラは1レンズあたり px_per_lenz / カメラ数 列しか印刷されないため、その列だけをレンダリングする
+        # （横方向のピクセル縦横比をカメラ数にして画角を保つ）
+        if self.is_consistent():
+            self.view_width = self.width // self.cam_num
+            self.pixel_aspect_x = self.cam_num
+        else:
+            self.view_width = self.width
+            self.pixel_aspect_x = 1
+
+        # 1ピクセルあたりのバイト数（8bit/16bitのPNGは整数のまま合成する）
+        image_settings = scene.render.image_settings
+        self.channels = self.CHANNELS.get(image_settings.color_mode, 4)
+        self.is_integer_compositing = image_settings.file_format == 'PNG'
+        if self.is_integer_compositing:
+            self.bytes_per_pixel = self.channels * int(image_settings.color_depth) // 8
+        else:
+            self.bytes_per_pixel = 4 * self.FLOAT_BYTES_PER_CHANNEL
+
+    # 実際の印刷幅(cm)
+    @property
+    def print_width_cm(self):
+        return self.width / self.dpi * self.INCH_MM / 10
+
+    # 全カメラのレンダリングピクセル数(メガピクセル)
+    @property
+    def megapixels(self):
+        return self.view_width * self.height * self.cam_num / 1000000
+
+    # レンチキュラー画像生成時のメモリ使用量の見積もり(バイト)
+    # 全視点画像に加え、最後の視点画像の読み込み中か、出力画像とその書き出し用の複製のどちらか大きい方を保持する
+    @property
+    def memory_bytes(self):
+        view_bytes = self.view_width * self.height * self.bytes_per_pixel
+        output_bytes = self.width * self.height * self.bytes_per_pixel
+        decode_bytes = 0
+        if self.is_integer_compositing:
+            decode_bytes = PngImage.get_decode_peak_bytes(self.view_width, self.height, self.bytes_per_pixel)
+        return view_bytes * self.cam_num + max(decode_bytes, output_bytes * 2)
+
+    # レンダリング画像のディスク使用量の上限(バイト)（圧縮前の大きさ）
+    @property
+    def disk_bytes(self):
+        bytes_per_pixel = self.bytes_per_pixel if self.is_integer_compositing else self.channels * 4
+        return self.view_width * self.height * bytes_per_pixel * self.cam_num
+
+    # 視点画像から生成するレンチキュラー画像の幅を取得する
+    # 計画どおり1/カメラ数の幅でレンダリングした画像なら印刷幅、それ以外（以前のバージョンの出力など）は同じ幅
+    def get_output_width(self, view_width, image_count):
+        if self.is_consistent() and view_width == self.view_width and image_count == self.cam_num:
+            return self.width
+        return view_width
+
+    # 計画が成り立つか
+    def is_consistent(self):
+        return len(self.errors) == 0
+
+    # シーンのレンダリング解像度が計画どおりか
+    def is_applied(self, scene):
+        render = scene.render
+        return render.resolution_x == self.view_width and render.resolution_y == self.height and \
+               render.resolution_percentage == 100 and \
+               render.pixel_aspect_x == self.pixel_aspect_x and render.pixel_aspect_y == 1
+
+    # レンダリングを開始できるか
+    def is_ready(self, scene):
+        return self.is_consistent() and self.is_applied(scene)
+
+    # 計画の内容を辞書で取得する
+    def to_dict(self):
+        return {
+            'width': self.width,
+            'view_width': self.view_width,
+            'height': self.height,
+            'pixel_aspect_x': self.pixel_aspect_x,
+            'lens_count': self.lens_count,
+            'print_width_cm': self.print_width_cm,
+            'megapixels': self.megapixels,
+            'memory_bytes': self.memory_bytes,
+            'disk_bytes': self.disk_bytes,
+            'errors': self.errors,
+        }
+
+
 # 設定反映
 class LENTI_OT_ApplySetting(bpy.types.Operator):
     bl_idname = "lenti.apply_setting"
@@ -408,20 +1012,20 @@ class LENTI_OT_ApplySetting(bpy.types.Operator):
     bl_description = "印刷・レンチキュラープロパティの設定を反映します。"
     bl_options = {'REGISTER', 'UNDO'}
 
-    # レンダリング画像の解像度を算出する
-    @classmethod
-    def trans_mm_to_pixel(cls, x_mm, y_mm, dpi):
-        inch_mm = 25.4
-        return x_mm * dpi / inch_mm, y_mm * dpi / inch_mm
-
     def execute(self, context):
-        # レンダリング解像度設定
-        render_width, render_height = self.trans_mm_to_pixel(context.scene.printWidthCm * 10, context.scene.printHeightCm * 10, context.scene.DPI)
+        # レンダリング計画が成り立たなければ反映しない
+        plan = RenderPlan(context.scene)
+        if not plan.is_consistent():
+            self.report({'ERROR'}, ' '.join(plan.errors))
+            return {'CANCELLED'}
 
-        scene = bpy.data.scenes["Scene"]
-        scene.render.resolution_x = render_width
-        scene.render.resolution_y = render_height
+        # レンダリング解像度設定
+        scene = context.scene
+        scene.render.resolution_x = plan.view_width
+        scene.render.resolution_y = plan.height
         scene.render.resolution_percentage = 100
+        scene.render.pixel_aspect_x = plan.pixel_aspect_x
+        scene.render.pixel_aspect_y = 1
 
         return {'FINISHED'}
 
@@ -441,37 +1045,39 @@ class LENTI_OT_GenerateResultImage(bpy.types.Operator):
 
     # レンチキュラー画像生成
     def generate(self, context):
+        rendered_image_path_list = LENTI_OT_Rendering.get_valid_image_path_list()
+        px_per_lenz = int(context.scene.DPI / context.scene.LPI)
+        plan = RenderPlan(context.scene)
+
+        # 8bit/16bitのPNGであれば整数のまま合成する
+        png_list = load_png_image_list(rendered_image_path_list)
+        if png_list is not None:
+            png_list.reverse()
+            first = png_list[0]
+            width = plan.get_output_width(first.width, len(png_list))
+            runs = get_interlace_column_runs(width, len(png_list), px_per_lenz, view_width=first.width)
+            data = interlace_pixel_arrays([img.data for img in png_list], runs)
+            PngImage(width, first.height, first.bit_depth, first.color_type, data).save(self.get_result_image_path())
+            return
+
+        # それ以外（EXR/HDRなど）は浮動小数点で合成する
         # 出力画像読み込み
-        rendered_image_path_list = LENTI_OT_Rendering.get_rendered_image_path_list()
         image_list = [bpy.data.images.load(path, check_existing=False) for path in rendered_image_path_list]
         image_list.reverse()
         pixels_list = [list(img.pixels[:]) for img in image_list]
 
         # 出力画像作成
-        new_image = bpy.data.images.new("result", width=image_list[0].size[0], height=image_list[0].size[1])
-
-        width = new_image.size[0]
-        height = new_image.size[1]
-        pixels = [None] * width * height
-
-        # ピクセル設定
+        view_width = image_list[0].size[0]
         image_count = len(image_list)
-        px_per_lenz = int(context.scene.DPI / context.scene.LPI)
-        for x in range(width):
-            img_select = math.floor(x * image_count / px_per_lenz) % image_count
-            for y in range(height):
-                r = pixels_list[img_select][(y * width + x) * 4 + 0]
-                g = pixels_list[img_select][(y * width + x) * 4 + 1]
-                b = pixels_list[img_select][(y * width + x) * 4 + 2]
-                a = pixels_list[img_select][(y * width + x) * 4 + 3]
-
-                pixels[(y * width) + x] = [r, g, b, a]
+        width = plan.get_output_width(view_width, image_count)
+        height = image_list[0].size[1]
+        new_image = bpy.data.images.new("result", width=width, height=height)
 
-        # flatten list
-        pixels = [chan for px in pixels for chan in px]
+        # ピクセル設定
+        runs = get_interlace_column_runs(width, image_count, px_per_lenz, view_width=view_width)
 
         # assign pixels
-        new_image.pixels = pixels
+        new_image.pixels = interlace_pixels(pixels_list, view_width, height, runs)
 
         new_image.filepath_raw = self.get_result_image_path()
         new_image.file_format = image_list[0].file_format
@@ -482,10 +1088,157 @@ class LENTI_OT_GenerateResultImage(bpy.types.Operator):
         return is_select_output_directory()
 
     def execute(self, context):
-        self.generate(context)
+        # 現在の設定でレンダリングが完了していないカメラがあれば、古い画像が混ざるため生成しない
+        if RenderManifest.exists() and len(LENTI_OT_Rendering.get_valid_image_path_list()) != context.scene.camNum:
+            self.report({'ERROR'}, "レンダリングが完了していないカメラがあります。撮影再開を実行してください。")
+            return {'CANCELLED'}
+
+        # 壊れたレンダリング画像があれば生成しない
+        try:
+            self.generate(context)
+        except BrokenImageError as e:
+            self.report({'ERROR'}, str(e))
+            return {'CANCELLED'}
 
-        # 生成完了時に画像を開く
-        open_image_in_main_window(self.get_result_image_path())
+        # 生成完了時に画像を開く（UIなしで実行している場合は開かない）
+        if not bpy.app.background:
+            open_image_in_main_window(self.get_result_image_path())
+
+        return {'FINISHED'}
+
+
+# 縮小画像でレンチキュラー画像をプレビューする
+class LENTI_OT_InterlacePreview(bpy.types.Operator):
+    bl_idname = "lenti.interlace_preview"
+    bl_label = "プレビュー"
+    bl_description = "縮小したレンダリング画像でレンチキュラー画像をプレビューします。設定変更時に自動で更新されます。"
+    bl_options = {'REGISTER'}
+
+    PREVIEW_IMAGE_NAME = 'LentiPreview'     # プレビュー画像の名前
+
+    proxy_cache = {}        # レンダリング画像の (パス, 更新時刻, サイズ) ごとの縮小画像のピクセル（高さ x 幅 x 4）
+    proxy_setting = None    # 縮小画像を読み込んだときの プレビュー幅, 横方向の拡大率
+    is_active = False       # プレビュー中か（設定変更時に更新する）
+
+    # 縮小画像を破棄する
+    @classmethod
+    def clear_proxies(cls):
+        cls.proxy_cache.clear()
+        cls.proxy_setting = None
+
+    # 縮小画像のキーを取得する（同じパスに再レンダリングされたら別の画像として扱う）
+    @staticmethod
+    def get_proxy_key(path):
+        stat = os.stat(path)
+        return (path, stat.st_mtime, stat.st_size)
+
+    # 縮小画像が読み込まれているか
+    @classmethod
+    def is_loaded(cls):
+        return len(cls.proxy_cache) > 0
+
+    # レンダリング画像を縮小して読み込む（読み込み済みの画像は再利用する）
+    @classmethod
+    def load_proxies(cls, context, path_list):
+        # プレビュー幅・視点画像の縦横比が変更されていれば読み込み直す
+        proxy_setting = (context.scene.previewWidth, get_view_stretch(context.scene))
+        if cls.proxy_setting != proxy_setting:
+            cls.clear_proxies()
+            cls.proxy_setting = proxy_setting
+        preview_width, stretch = proxy_setting
+
+        # 無効になった・書き換えられたレンダリング画像の縮小画像を破棄する
+        key_list = [cls.get_proxy_key(p) for p in path_list]
+        for key in [k for k in cls.proxy_cache if k not in key_list]:
+            del cls.proxy_cache[key]
+
+        for path, key in zip(path_list, key_list):
+            if key in cls.proxy_cache:
+                continue
+
+            # 1/カメラ数の幅でレンダリングした画像は印刷時の縦横比に戻して縮小する
+            img = bpy.data.images.load(path, check_existing=False)
+            proxy_width = min(preview_width, img.size[0] * stretch)
+            proxy_height = max(1, round(img.size[1] * proxy_width / (img.size[0] * stretch)))
+            img.scale(proxy_width, proxy_height)
+            cls.proxy_cache[key] = np.array(img.pixels[:], dtype=np.float32).reshape(proxy_height, proxy_width, 4)
+            bpy.data.images.remove(img)
+
+    # プレビュー画像を取得する（大きさが違えば作り直す）
+    @classmethod
+    def get_preview_image(cls, width, height):
+        image = bpy.data.images.get(cls.PREVIEW_IMAGE_NAME)
+        if image is not None and (image.size[0] != width or image.size[1] != height):
+            bpy.data.images.remove(image)
+            image = None
+
+        if image is None:
+            image = bpy.data.images.new(cls.PREVIEW_IMAGE_NAME, width=width, height=height)
+        return image
+
+    # プレビュー画像を黒で塗りつぶす（現在の設定ではプレビューできないことを示す）
+    @classmethod
+    def clear_preview_image(cls):
+        image = bpy.data.images.get(cls.PREVIEW_IMAGE_NAME)
+        if image is None:
+            return
+        image.pixels = [0.0] * len(image.pixels)
+        image.update()
+        redraw_image_editor()
+
+    # 現在の設定でプレビュー画像を更新する
+    # force が False ならプレビュー中の場合だけ更新する
+    # プレビューできなければプレビュー画像を塗りつぶして False を返す
+    @classmethod
+    def refresh(cls, context, force=False):
+        if not force and not cls.is_active:
+            return False
+
+        # LPI が DPI より大きいと1レンズ分の画素がない
+        px_per_lenz = int(context.scene.DPI / context.scene.LPI)
+        if px_per_lenz < 1:
+            cls.clear_preview_image()
+            return False
+
+        # カメラ数の変更などで有効な画像がなくなれば再レンダリングが必要
+        path_list = LENTI_OT_Rendering.get_valid_image_path_list()
+        cls.load_proxies(context, path_list)
+        if not cls.is_loaded():
+            cls.clear_preview_image()
+            return False
+
+        # レンチキュラー画像生成と同じ順番で並べる
+        proxy_list = [cls.proxy_cache[cls.get_proxy_key(p)] for p in reversed(path_list)]
+
+        # レンズ単位の幅に揃えて縮小する（1レンズ分の列の並びはそのままに、レンズ数を減らす）
+        proxy_height, proxy_width = proxy_list[0].shape[:2]
+        width = max(1, proxy_width // px_per_lenz) * px_per_lenz
+        height = max(1, round(proxy_height * width / proxy_width))
+        row_index = np.arange(height) * proxy_height // height
+        column_index = np.arange(width) * proxy_width // width
+        array_list = [proxy[row_index][:, column_index] for proxy in proxy_list]
+
+        runs = get_interlace_column_runs(width, len(array_list), px_per_lenz)
+        image = cls.get_preview_image(width, height)
+        image.pixels = interlace_pixel_arrays(array_list, runs).ravel().tolist()
+        image.update()
+        redraw_image_editor()
+        return True
+
+    @classmethod
+    def poll(cls, context):
+        return is_select_output_directory() and os.path.isdir(LENTI_OT_Rendering.get_output_directory())
+
+    def execute(self, context):
+        # 縮小画像を読み込み直す
+        self.clear_proxies()
+        if not self.refresh(context, force=True):
+            self.report({'ERROR'}, "現在の設定ではプレビューできません。LPI・DPIを確認するか、レンダリングし直してください。")
+            return {'CANCELLED'}
+        LENTI_OT_InterlacePreview.is_active = True
+
+        # プレビュー画像を開く
+        show_image_in_image_editor(bpy.data.images[self.PREVIEW_IMAGE_NAME])
 
         return {'FINISHED'}
 
@@ -510,7 +1263,7 @@ class ShowStereoscopicDialogMenu(bpy.types.Operator):
     bl_options = {'REGISTER', 'UNDO'}
 
     def get_image_enum(self, context):
-        return [(path, path, path) for path in LENTI_OT_Rendering.get_rendered_image_path_list()]
+        return [(path, path, path) for path in LENTI_OT_Rendering.get_valid_image_path_list()]
 
     left_image_prop = bpy.props.EnumProperty(
         name="leftImage",
@@ -543,8 +1296,21 @@ class ShowStereoscopicDialogMenu(bpy.types.Operator):
 
     # 立体視画像生成
     def generate(self, context, left, right):
+        rendered_image_path_list = LENTI_OT_Rendering.get_valid_image_path_list()
+
+        # 8bit/16bitのPNGであれば整数のまま合成する
+        png_list = load_png_image_list([rendered_image_path_list[left], rendered_image_path_list[right]])
+        stretch = get_view_stretch(context.scene)
+        if png_list is not None:
+            png_left, png_right = png_list
+            # 1/カメラ数の幅でレンダリングした画像は横に引き伸ばして印刷時の縦横比に戻す
+            data = np.repeat(np.concatenate((png_left.data, png_right.data), axis=1), stretch, axis=1)
+            PngImage(png_left.width * 2 * stretch, png_left.height, png_left.bit_depth, png_left.color_type, data).save(
+                self.get_result_image_path())
+            return True
+
+        # それ以外（EXR/HDRなど）は浮動小数点で合成する
         # 出力画像読み込み
-        rendered_image_path_list = LENTI_OT_Rendering.get_rendered_image_path_list()
         image_left = bpy.data.images.load(rendered_image_path_list[left], check_existing=False)
         image_right = bpy.data.images.load(rendered_image_path_list[right], check_existing=False)
         pixels_left = image_left.pixels[:]
@@ -555,28 +1321,17 @@ class ShowStereoscopicDialogMenu(bpy.types.Operator):
             return False
 
         # 出力画像作成
-        width_left = image_left.size[0]
-        width_right = image_right.size[0]
-        width_result = width_left + width_right
+        width = image_left.size[0]
         height_result = image_left.size[1]
-        new_image = bpy.data.images.new("stereoscopic", width=width_result, height=height_result)
-        pixels_result = []
-
-        # ピクセル設定
-        for y in range(height_result):
-            # 左画像の横一列をコピーする
-            left = pixels_left[y * width_left * 4:(y + 1) * width_left * 4]
-            pixels_result.append(left)
+        new_image = bpy.data.images.new("stereoscopic", width=width * 2 * stretch, height=height_result)
 
-            # 右画像の横一列をコピーする
-            right = pixels_right[y * width_right * 4:(y + 1) * width_right * 4]
-            pixels_result.append(right)
-
-        # flatten list
-        pixels_result = [chan for px in pixels_result for chan in px]
+        # ピクセル設定（左右の画像を横に並べ、1/カメラ数の幅でレンダリングした画像は横に引き伸ばす）
+        array_left = np.array(pixels_left, dtype=np.float32).reshape(height_result, width, 4)
+        array_right = np.array(pixels_right, dtype=np.float32).reshape(height_result, width, 4)
+        pixels_result = np.repeat(np.concatenate((array_left, array_right), axis=1), stretch, axis=1)
 
         # assign pixels
-        new_image.pixels = pixels_result
+        new_image.pixels = pixels_result.ravel().tolist()
 
         new_image.filepath_raw = self.get_result_image_path()
         new_image.file_format = image_left.file_format
@@ -589,14 +1344,20 @@ class ShowStereoscopicDialogMenu(bpy.types.Operator):
         return is_select_output_directory()
 
     def execute(self, context):
-        image_path_list = LENTI_OT_Rendering.get_rendered_image_path_list()
+        image_path_list = LENTI_OT_Rendering.get_valid_image_path_list()
         left_image_index = image_path_list.index(self.left_image_prop)
         right_image_index = image_path_list.index(self.right_image_prop)
-        if not self.generate(context, left_image_index, right_image_index):
+        # 壊れたレンダリング画像があれば生成しない
+        try:
+            if not self.generate(context, left_image_index, right_image_index):
+                return {'CANCELLED'}
+        except BrokenImageError as e:
+            self.report({'ERROR'}, str(e))
             return {'CANCELLED'}
 
-        # 生成完了時に画像を開く
-        open_image_in_main_window(self.get_result_image_path())
+        # 生成完了時に画像を開く（UIなしで実行している場合は開かない）
+        if not bpy.app.background:
+            open_image_in_main_window(self.get_result_image_path())
 
         return {'FINISHED'}
 
@@ -609,6 +1370,11 @@ class LENTI_PT_Menu(bpy.types.Panel):
     bl_category = "LentiMaker"  # タブを開いた時のヘッダーに表示される文字列
     bl_context = "objectmode"   # パネルを表示するコンテキスト
 
+    # インターレースに関わる設定の更新時に呼び出される
+    def onInterlaceSettingUpdate(self, context):
+        # プレビューを更新する
+        LENTI_OT_InterlacePreview.refresh(context)
+
     # 焦点距離更新時に呼び出される
     def onFocusDistUpdate(self, context):
         # カメラ位置を更新する
@@ -625,6 +1391,7 @@ class LENTI_PT_Menu(bpy.types.Panel):
             bpy.types.Scene.camPreview = bpy.props.IntProperty(default=context.scene.camPreview, min=0, max=context.scene.camNum - 1)
 
         LENTI_OT_BuildStudio.arrange_camera(context)
+        LENTI_OT_InterlacePreview.refresh(context)
 
     # カメラプレビュー更新時に呼び出される
     def onCamPreviewUpdate(self, context):
@@ -649,10 +1416,10 @@ class LENTI_PT_Menu(bpy.types.Panel):
         return [(str(i), x.name, x.name) for i, x in enumerate(get_camera_list())]
 
     # 印刷DPIプロパティ（1インチあたりに何個ドット並んでいるかという解像度の単位）
-    bpy.types.Scene.DPI = bpy.props.IntProperty(default=300, name='DPI', min=100)
+    bpy.types.Scene.DPI = bpy.props.IntProperty(default=300, name='DPI', min=100, update=onInterlaceSettingUpdate)
 
     # レンチキュラーLPIプロパティ（1インチあたりに何個レンズ（かまぼこ）があるかという単位）
-    bpy.types.Scene.LPI = bpy.props.IntProperty(default=60, name='LPI', min=10)
+    bpy.types.Scene.LPI = bpy.props.IntProperty(default=60, name='LPI', min=10, update=onInterlaceSettingUpdate)
 
     # 印刷サイズプロパティ(cm)
     bpy.types.Scene.printWidthCm = bpy.props.FloatProperty(default=9.1, name='PrintWidthCm', min=1.0)
@@ -665,7 +1432,7 @@ class LENTI_PT_Menu(bpy.types.Panel):
     bpy.types.Scene.focusDist = bpy.props.FloatProperty(default=3.0, name='FocusDist', min=1.0, update=onFocusDistUpdate)
 
     # レンダリングカメラ数設定プロパティ
-    bpy.types.Scene.camNum = bpy.props.IntProperty(default=2, name='camNum', min=2, update=onCamNumUpdate)
+    bpy.types.Scene.camNum = bpy.props.IntProperty(default=5, name='camNum', min=2, update=onCamNumUpdate)
 
     # レンダリングカメラ配置間隔設定プロパティ
     bpy.types.Scene.camAngleDiff = bpy.props.FloatProperty(default=30.0, name='camAngleDiff', min=1.0, update=onCameraAngleDiffUpdate)
@@ -676,6 +1443,9 @@ class LENTI_PT_Menu(bpy.types.Panel):
     # 出力先プロパティ
     bpy.types.Scene.outputDirectory = bpy.props.StringProperty()
 
+    # プレビュー画像の幅プロパティ(px)
+    bpy.types.Scene.previewWidth = bpy.props.IntProperty(default=320, name='PreviewWidth', min=16, update=onInterlaceSettingUpdate)
+
     # メニューの描画処理
     def draw(self, context):
 
@@ -703,6 +1473,19 @@ class LENTI_PT_Menu(bpy.types.Panel):
         # 設定反映ボタン
         self.layout.operator(LENTI_OT_ApplySetting.bl_idname)
 
+        # レンダリング計画
+        plan = RenderPlan(context.scene)
+        if plan.is_consistent():
+            self.layout.label(text="レンダリング解像度 %d x %d px / カメラ（印刷 %d x %d px、レンズ %d 個、印刷幅 %.2f cm）" % (
+                plan.view_width, plan.height, plan.width, plan.height, plan.lens_count, plan.print_width_cm))
+            self.layout.label(text="合計 %.1f MP / メモリ 約 %.0f MB / ディスク 最大 %.0f MB" % (
+                plan.megapixels, plan.memory_bytes / 1024 ** 2, plan.disk_bytes / 1024 ** 2))
+            if not plan.is_applied(context.scene):
+                self.layout.label(text="設定反映を実行してください。", icon='ERROR')
+        else:
+            for error in plan.errors:
+                self.layout.label(text=error, icon='ERROR')
+
         self.layout.separator()     # ------------------------------------------
 
         # メインカメラ選択
@@ -746,7 +1529,9 @@ class LENTI_PT_Menu(bpy.types.Panel):
             self.layout.label(text="出力先を選択してください。", icon='ERROR')
 
         # 撮影ボタン
-        self.layout.operator(LENTI_OT_Rendering.bl_idname)
+        row = self.layout.row(align=True)
+        row.operator(LENTI_OT_Rendering.bl_idname)
+        row.operator(LENTI_OT_ResumeRendering.bl_idname)
 
         # 出力画像一覧
         image_path_list = LENTI_OT_Rendering.get_rendered_image_path_list()
@@ -762,6 +1547,13 @@ class LENTI_PT_Menu(bpy.types.Panel):
         # レンチキュラー画像生成ボタン
         self.layout.operator(LENTI_OT_GenerateResultImage.bl_idname)
 
+        # プレビュー
+        row = self.layout.row(align=True)
+        row.prop(context.scene, "previewWidth")
+        row.operator(LENTI_OT_InterlacePreview.bl_idname)
+        if LENTI_OT_InterlacePreview.is_active and not LENTI_OT_InterlacePreview.is_loaded():
+            self.layout.label(text="プレビューするには再レンダリングが必要です", icon='ERROR')
+
         # 立体視画像生成ボタン
         self.layout.operator(ShowStereoscopicDialogMenu.bl_idname)
 